@@ -11,9 +11,82 @@ bl_info = {
 
 import bpy
 from bpy.types import Operator
+from mathutils import Quaternion, Vector
 
 # ---- helpers ----
 
+# View rotations matching Blender's numpad defaults. Writing these directly to
+# region_3d is far cheaper than going through bpy.ops (no poll/undo/redraw).
+_AXIS_QUATS = {
+    'TOP': Quaternion((1.0, 0.0, 0.0, 0.0)),
+    'BOTTOM': Quaternion((0.0, 1.0, 0.0, 0.0)),
+    'FRONT': Quaternion((0.70710678, 0.70710678, 0.0, 0.0)),
+    'BACK': Quaternion((0.0, 0.0, 0.70710678, 0.70710678)),
+    'RIGHT': Quaternion((0.5, 0.5, 0.5, 0.5)),
+    'LEFT': Quaternion((0.5, 0.5, -0.5, -0.5)),
+}
+
+# +90 deg around Z, used to force distinct axes when both views end up equal
+_Z90 = Quaternion((0.70710678, 0.0, 0.0, 0.70710678))
+
+# Bound once at register(): which view-axis operator this Blender exposes and
+# the kwargs its signature accepts. Avoids per-call try/except cascades.
+_VIEW_AXIS_CALL = None
+_VIEW_AXIS_KWARGS = {}
+
+# Version-gated RNA attributes, probed once at import instead of paying a
+# raised/caught AttributeError on every call.
+_HAS_HUD = 'show_region_hud' in bpy.types.SpaceView3D.bl_rna.properties
+
+# Space flags hidden for the silhouette look. Written in one pass, skipping
+# flags already at the target value so no redundant RNA setters/redraws fire.
+_UI_HIDE = (
+    ('show_region_header', False),
+    ('show_region_tool_header', False),
+    ('show_region_toolbar', False),
+    ('show_region_ui', False),
+    ('show_gizmo', False),
+    ('show_gizmo_navigate', False),
+)
+
+
+def _hide_ui(space):
+    for attr, value in _UI_HIDE:
+        if getattr(space, attr, value) != value:
+            setattr(space, attr, value)
+    if _HAS_HUD:
+        space.show_region_hud = False
+    if space.overlay.show_overlays:
+        space.overlay.show_overlays = False
+
+
+def _probe_view_axis_operator():
+    global _VIEW_AXIS_CALL, _VIEW_AXIS_KWARGS
+    # bpy.ops builds operator wrappers lazily, so hasattr() is always True
+    # even for removed operators; get_rna_type() is what validates existence.
+    op = bpy.ops.view3d.viewnumpad
+    rna = None
+    try:
+        rna = op.get_rna_type()
+    except Exception:
+        op = bpy.ops.view3d.view_axis
+        try:
+            rna = op.get_rna_type()
+        except Exception:
+            pass
+    kwargs = {}
+    if rna is not None and 'align_active' in rna.properties:
+        kwargs['align_active'] = False
+    _VIEW_AXIS_CALL = op
+    _VIEW_AXIS_KWARGS = kwargs
+
+
+def _window_region(area: bpy.types.Area):
+    """Resolve the WINDOW region of an area. Resolve once and pass the result
+    around instead of re-walking area.regions at each use site."""
+    return next((r for r in area.regions if r.type == 'WINDOW'), None)
+
+
 def _find_window_view3d_area(win: bpy.types.Window):
     area_view3d = None
     region_window = None
@@ -23,129 +96,102 @@ def _find_window_view3d_area(win: bpy.types.Window):
                 area_view3d = area
                 break
         if area_view3d:
-            for region in area_view3d.regions:
-                if region.type == 'WINDOW':
-                    region_window = region
-                    break
+            region_window = _window_region(area_view3d)
     except Exception:
         pass
     return area_view3d, region_window
 
 
-def _override(win=None, area=None, region=None):
-    # Safe override: DO NOT dereference win.screen (can crash in timers)
-    ov = {}
-    if win is not None:
-        ov['window'] = win
-    if area is not None:
-        ov['area'] = area
-    if region is not None:
-        ov['region'] = region
-    return ov
-
-
 def _apply_view_axis(win, area, region, axis: str):
-    """Use the same operator as numpad: view3d.viewnumpad, enforce ORTHO, then lock the resulting rotation."""
-    # Force ORTHO first
-    try:
-        area.spaces.active.region_3d.view_perspective = 'ORTHO'
-    except Exception:
-        pass
-    try:
-        screen = getattr(win, 'screen', None)
-        with bpy.context.temp_override(window=win, screen=screen, area=area, region=region):
-            try:
-                bpy.ops.view3d.viewnumpad(type=axis, align_active=False)
-            except Exception:
-                try:
-                    bpy.ops.view3d.view_axis(type=axis, align_active=False)
-                except Exception:
-                    bpy.ops.view3d.view_axis(type=axis)
-    except Exception:
-        # Last resort: try legacy override
-        ov = _override(None, area, region)
+    """Set the view to the given axis: direct quaternion write, operator fallback."""
+    # Fast path: write the precomputed quaternion straight to region_3d.
+    # This is equivalent to the numpad operator without poll/undo/redraw cost.
+    r3d = area.spaces.active.region_3d
+    quat = _AXIS_QUATS.get(axis)
+    if r3d is not None and quat is not None:
+        r3d.view_perspective = 'ORTHO'
+        r3d.view_rotation = quat
+        return
+    # Fallback: go through the operator probed at register()
+    if _VIEW_AXIS_CALL is not None:
         try:
-            bpy.ops.view3d.viewnumpad(ov, type=axis, align_active=False)
+            # window+area+region is the minimal override the operator needs;
+            # every extra key is validated and pushed by temp_override
+            with bpy.context.temp_override(window=win, area=area, region=region):
+                _VIEW_AXIS_CALL(type=axis, **_VIEW_AXIS_KWARGS)
         except Exception:
-            try:
-                bpy.ops.view3d.view_axis(ov, type=axis, align_active=False)
-            except Exception:
-                try:
-                    bpy.ops.view3d.view_axis(ov, type=axis)
-                except Exception:
-                    pass
+            pass
     # Lock in the resulting quaternion so Blender won't drift
-    try:
-        q = area.spaces.active.region_3d.view_rotation.copy()
-        area.spaces.active.region_3d.view_rotation = q
-    except Exception:
-        pass
+    r3d = area.spaces.active.region_3d
+    if r3d is not None:
+        r3d.view_rotation = r3d.view_rotation.copy()
 
 
-def _configure_silhouette_area(context, win, area, region, axis: str):
+def _reassert(win, area, region, axis: str):
+    """Apply the axis and hide the UI chrome for one area, in one pass."""
+    _apply_view_axis(win, area, region, axis)
+    _hide_ui(area.spaces.active)
+
+
+def _selection_objects(context):
+    """Resolve the objects to frame. Screen-context members like
+    selected_objects are only available while the operator context is valid,
+    so call this in execute() and pass the result into timer callbacks."""
+    objs = list(context.selected_objects)
+    if not objs:
+        active = context.view_layer.objects.active
+        if active is not None:
+            objs = [active]
+    return objs
+
+
+def _frame_selection(r3d, objs):
+    """Center the view on the objects' world bounding box.
+    Cheaper than view3d.view_selected: no poll, no undo push, no extra redraws."""
+    if not objs:
+        return
+    bb_min = Vector((float('inf'),) * 3)
+    bb_max = Vector((float('-inf'),) * 3)
+    for obj in objs:
+        mw = obj.matrix_world
+        for corner in obj.bound_box:
+            co = mw @ Vector(corner)
+            for i in range(3):
+                if co[i] < bb_min[i]:
+                    bb_min[i] = co[i]
+                if co[i] > bb_max[i]:
+                    bb_max[i] = co[i]
+    if bb_min.x > bb_max.x:
+        return
+    r3d.view_location = (bb_min + bb_max) * 0.5
+    r3d.view_distance = max((bb_max - bb_min).length * 0.7, 1.0)
+
+
+def _configure_silhouette_area(context, win, area, region, axis: str, objs=None):
     """Configure the given VIEW_3D area to silhouette style and axis."""
-    # Ensure editor type is VIEW_3D
-    try:
+    # Ensure editor and UI type are VIEW_3D (skip the setters when already set)
+    if area.type != 'VIEW_3D':
         area.type = 'VIEW_3D'
-    except Exception:
-        pass
-    # Ensure correct UI type
-    try:
+    if area.ui_type != 'VIEW_3D':
         area.ui_type = 'VIEW_3D'
-    except Exception:
-        pass
     space = area.spaces.active
-    # Silhouette styling
+    # Silhouette styling -- plain enum/color writes, none of these raise on 4.5
+    sh = space.shading
+    sh.type = 'SOLID'
+    sh.light = 'FLAT'
+    sh.color_type = 'SINGLE'
+    sh.single_color = (0.0, 0.0, 0.0)
+    sh.background_type = 'VIEWPORT'
+    sh.background_color = (1.0, 1.0, 1.0)
+
+    # Hide UI chrome and apply the axis, then frame the selection directly
+    # from its bounding box. No operator touches the view, so no re-apply is
+    # needed afterwards.
+    _reassert(win, area, region, axis)
+    if objs is None:
+        objs = _selection_objects(context)
     try:
-        sh = space.shading
-        sh.type = 'SOLID'
-        sh.light = 'FLAT'
-        sh.color_type = 'SINGLE'
-        sh.single_color = (0.0, 0.0, 0.0)
-        sh.background_type = 'VIEWPORT'
-        sh.background_color = (1.0, 1.0, 1.0)
-    except Exception:
-        pass
-
-    # Hide UI & overlays/gizmos
-    try:
-        space.show_region_header = False
-        space.show_region_tool_header = False
-        space.show_region_toolbar = False
-        space.show_region_ui = False
-        try:
-            # Hide HUD if Blender exposes it
-            space.show_region_hud = False
-        except Exception:
-            pass
-        space.show_gizmo = False
-        space.show_gizmo_navigate = False
-        space.overlay.show_overlays = False
-    except Exception:
-        pass
-
-    # Apply axis, frame selection, then re-apply axis to keep it distinct
-    _apply_view_axis(win, area, region, axis)
-    try:
-        screen = getattr(win, 'screen', None)
-        with bpy.context.temp_override(window=win, screen=screen, area=area, region=region):
-            bpy.ops.view3d.view_selected(use_all_regions=False)
-    except Exception:
-        pass
-    _apply_view_axis(win, area, region, axis)
-    # Re-hide UI to ensure nothing pops back
-    try:
-        space.show_region_header = False
-        space.show_region_tool_header = False
-        space.show_region_toolbar = False
-        space.show_region_ui = False
-        space.show_gizmo = False
-        space.show_gizmo_navigate = False
-        space.overlay.show_overlays = False
-        try:
-            area.tag_redraw()
-        except Exception:
-            pass
+        _frame_selection(space.region_3d, objs)
     except Exception:
         pass
 
@@ -154,20 +200,20 @@ def _split_area_and_get_new(win: bpy.types.Window, area: bpy.types.Area, directi
     """Split the given area and return the newly created area deterministically.
     If direction='VERTICAL' -> return the area to the right. If 'HORIZONTAL' -> area above.
     """
-    region_window = next((r for r in area.regions if r.type == 'WINDOW'), None)
+    region_window = _window_region(area)
     if not region_window:
         return None
     # Use the owning screen from the area itself to avoid referencing win.screen
     screen = getattr(area, 'id_data', None)
     if screen is None:
         return None
-    # Only pass area+region to area_split
-    ov = {'area': area, 'region': region_window}
-    before = list(screen.areas)
+    # Only pass area+region to area_split (4.0+ canonical override form)
+    before_ptrs = {a.as_pointer() for a in screen.areas}
     orig_x, orig_y = area.x, area.y
     ok = False
     try:
-        bpy.ops.screen.area_split(ov, direction=direction, factor=factor)
+        with bpy.context.temp_override(area=area, region=region_window):
+            bpy.ops.screen.area_split(direction=direction, factor=factor)
         ok = True
     except Exception:
         pass
@@ -175,28 +221,29 @@ def _split_area_and_get_new(win: bpy.types.Window, area: bpy.types.Area, directi
         try:
             cx = area.x + max(1, int(area.width * factor))
             cy = area.y + max(1, int(area.height * factor))
-            bpy.ops.screen.area_split(ov, direction=direction, cursor=(cx, cy))
+            with bpy.context.temp_override(area=area, region=region_window):
+                bpy.ops.screen.area_split(direction=direction, cursor=(cx, cy))
             ok = True
         except Exception:
             return None
 
-    candidates = [a for a in screen.areas if a not in before and a.type == area.type]
+    candidates = [a for a in screen.areas if a.as_pointer() not in before_ptrs and a.type == area.type]
     if not candidates:
-        candidates = [a for a in screen.areas if a not in before]
+        candidates = [a for a in screen.areas if a.as_pointer() not in before_ptrs]
     if not candidates:
         if direction == 'VERTICAL':
-            rights = [a for a in screen.areas if a.type == area.type and a.x > orig_x]
-            return max(rights, key=lambda a: a.x, default=None)
+            return max((a for a in screen.areas if a.type == area.type and a.x > orig_x),
+                       key=lambda a: a.x, default=None)
         else:
-            uppers = [a for a in screen.areas if a.type == area.type and a.y > orig_y]
-            return max(uppers, key=lambda a: a.y, default=None)
+            return max((a for a in screen.areas if a.type == area.type and a.y > orig_y),
+                       key=lambda a: a.y, default=None)
 
+    # Single extremum scan; the bool ranks candidates beyond the original
+    # area's edge first, then the coordinate breaks ties
     if direction == 'VERTICAL':
-        pref = [a for a in candidates if a.x > orig_x]
-        return max(pref or candidates, key=lambda a: a.x)
+        return max(candidates, key=lambda a: (a.x > orig_x, a.x))
     else:
-        pref = [a for a in candidates if a.y > orig_y]
-        return max(pref or candidates, key=lambda a: a.y)
+        return max(candidates, key=lambda a: (a.y > orig_y, a.y))
 
 
 # ---- operator ----
@@ -244,62 +291,39 @@ class VIEW3D_OT_open_silhouette_view_dual(Operator):
         except Exception:
             pass
 
-        # Defer split and configuration to ensure the new window is fully ready
+        # Capture the selection while the operator context is still valid;
+        # inside the timer the screen-context members are unavailable
+        sel_objs = _selection_objects(context)
+
+        # Defer split and configuration to ensure the new window is fully ready.
+        # One-shot: on failure re-register a fresh one-shot a bounded number of
+        # times instead of polling via a repeating timer.
+        attempts = [3]
+
         def _deferred_setup():
             try:
                 area_a, region_a = _find_window_view3d_area(new_win)
                 if area_a is None or region_a is None:
-                    return 0.05  # retry shortly
+                    attempts[0] -= 1
+                    if attempts[0] > 0:
+                        bpy.app.timers.register(_deferred_setup, first_interval=0.1)
+                    return None
                 # Split horizontally to create TOP/BOTTOM
-                screen = getattr(new_win, 'screen', None)
-                before = list(screen.areas) if screen else []
-                ok = False
-                try:
-                    with bpy.context.temp_override(window=new_win, area=area_a, region=region_a):
-                        bpy.ops.screen.area_split(direction='HORIZONTAL', factor=0.5)
-                    ok = True
-                except Exception:
-                    try:
-                        cy = area_a.y + max(1, int(area_a.height * 0.5))
-                        with bpy.context.temp_override(window=new_win, area=area_a, region=region_a):
-                            bpy.ops.screen.area_split(direction='HORIZONTAL', cursor=(area_a.x + 5, cy))
-                        ok = True
-                    except Exception:
-                        return 0.05
-                if not ok:
-                    return 0.05
-                # Identify new area and map to top/bottom
-                screen = getattr(new_win, 'screen', None)
-                new_candidates = [a for a in (screen.areas if screen else []) if a not in before]
-                if not new_candidates:
-                    return 0.05
-                new_area = new_candidates[0]
+                new_area = _split_area_and_get_new(new_win, area_a, direction='HORIZONTAL', factor=0.5)
+                if new_area is None:
+                    return None
+                # Helper returns the area above for HORIZONTAL splits
                 if area_a.y >= new_area.y:
                     area_top, area_bottom = area_a, new_area
                 else:
                     area_top, area_bottom = new_area, area_a
-                reg_top = next((r for r in area_top.regions if r.type == 'WINDOW'), None)
-                reg_bottom = next((r for r in area_bottom.regions if r.type == 'WINDOW'), None)
+                reg_top = _window_region(area_top)
+                reg_bottom = _window_region(area_bottom)
                 if not reg_top or not reg_bottom:
-                    return 0.05
+                    return None
                 # Configure both areas
-                _configure_silhouette_area(context, new_win, area_top, reg_top, axis='FRONT')
-                _configure_silhouette_area(context, new_win, area_bottom, reg_bottom, axis='RIGHT')
-                _apply_view_axis(new_win, area_top, reg_top, 'FRONT')
-                _apply_view_axis(new_win, area_bottom, reg_bottom, 'RIGHT')
-                # One-time UI reassert
-                for a in (area_top, area_bottom):
-                    try:
-                        sp = a.spaces.active
-                        sp.show_region_header = False
-                        sp.show_region_tool_header = False
-                        sp.show_region_toolbar = False
-                        sp.show_region_ui = False
-                        sp.show_gizmo = False
-                        sp.show_gizmo_navigate = False
-                        sp.overlay.show_overlays = False
-                    except Exception:
-                        pass
+                _configure_silhouette_area(context, new_win, area_top, reg_top, axis='FRONT', objs=sel_objs)
+                _configure_silhouette_area(context, new_win, area_bottom, reg_bottom, axis='RIGHT', objs=sel_objs)
                 # One-time distance backoff
                 try:
                     r3d_top = area_top.spaces.active.region_3d
@@ -310,7 +334,9 @@ class VIEW3D_OT_open_silhouette_view_dual(Operator):
                     r3d_bot.view_distance = dist
                 except Exception:
                     pass
-                
+                # Single redraw per area once everything is configured
+                area_top.tag_redraw()
+                area_bottom.tag_redraw()
                 return None
             except Exception:
                 return None
@@ -339,74 +365,35 @@ class VIEW3D_OT_open_silhouette_split_current(Operator):
 
     def execute(self, context):
         area = context.area
-        region = next((r for r in area.regions if r.type == 'WINDOW'), None)
+        region = _window_region(area)
         if region is None:
             self.report({'ERROR'}, "No WINDOW region in current area.")
             return {'CANCELLED'}
 
         win = context.window
-        scr = context.screen
-        ov = {'area': area, 'region': region}
 
         # 1) Split current area vertically into LEFT and RIGHT
-        before = list(scr.areas)
-        orig_x = area.x
-        try:
-            bpy.ops.screen.area_split(direction='VERTICAL', factor=0.5)
-        except Exception:
-            try:
-                cx = area.x + max(1, int(area.width * 0.5))
-                cy = area.y + max(1, int(area.height * 0.5))
-                bpy.ops.screen.area_split(direction='VERTICAL', cursor=(cx, cy))
-            except Exception as e:
-                self.report({'ERROR'}, f"Failed to split current area: {e}")
-                return {'CANCELLED'}
-
-        new_areas = [a for a in scr.areas if a not in before]
-        # Determine LEFT and RIGHT by x
-        if not new_areas:
-            self.report({'ERROR'}, "Could not determine new split area.")
+        area_right = _split_area_and_get_new(win, area, direction='VERTICAL', factor=0.5)
+        if area_right is None:
+            self.report({'ERROR'}, "Failed to split current area.")
             return {'CANCELLED'}
-        area_right = max(new_areas, key=lambda a: a.x)
         area_left = area if area.x <= area_right.x else area_right
-        if area_right is area_left:
-            # Fallback pick by x
-            sorted_by_x = sorted([area] + new_areas, key=lambda a: a.x)
-            area_left, area_right = sorted_by_x[0], sorted_by_x[-1]
-
-        # 2) Split LEFT area horizontally into TOP/BOTTOM (or above/below)
-        before2 = list(scr.areas)
-        # Make LEFT area active context for split
-        try:
-            for r in area_left.regions:
-                if r.type == 'WINDOW':
-                    with context.temp_override(area=area_left, region=r):
-                        try:
-                            bpy.ops.screen.area_split(direction='HORIZONTAL', factor=0.5)
-                        except Exception:
-                            cy = area_left.y + max(1, int(area_left.height * 0.5))
-                            bpy.ops.screen.area_split(direction='HORIZONTAL', cursor=(area_left.x + 5, cy))
-                    break
-        except Exception as e:
-            self.report({'ERROR'}, f"Failed to split left area: {e}")
-            return {'CANCELLED'}
 
-        new_areas2 = [a for a in scr.areas if a not in before2]
-        if not new_areas2:
-            self.report({'ERROR'}, "Could not determine sub-areas of left split.")
-            return {'CANCELLED'}
-        # Identify the two left sub-areas by x proximity to area_left.x
-        left_subs = sorted([a for a in new_areas2 + [area_left] if a.type == 'VIEW_3D'], key=lambda a: (abs(a.x - area_left.x), -a.y))[:2]
-        if len(left_subs) < 2:
-            self.report({'ERROR'}, "Left split did not produce two VIEW_3D areas.")
+        # 2) Split LEFT area horizontally into TOP/BOTTOM
+        new_area = _split_area_and_get_new(win, area_left, direction='HORIZONTAL', factor=0.5)
+        if new_area is None:
+            self.report({'ERROR'}, "Failed to split left area.")
             return {'CANCELLED'}
-        # top is higher y
-        left_top, left_bottom = sorted(left_subs, key=lambda a: a.y, reverse=True)
+        # Helper returns the area above for HORIZONTAL splits; keep the
+        # y-comparison in case Blender handed back the lower half
+        if area_left.y >= new_area.y:
+            left_top, left_bottom = area_left, new_area
+        else:
+            left_top, left_bottom = new_area, area_left
 
-        # Resolve regions
-        get_win_region = lambda a: next((r for r in a.regions if r.type == 'WINDOW'), None)
-        reg_top = get_win_region(left_top)
-        reg_bottom = get_win_region(left_bottom)
+        # Resolve regions once per area
+        reg_top = _window_region(left_top)
+        reg_bottom = _window_region(left_bottom)
         if not reg_top or not reg_bottom:
             self.report({'ERROR'}, "Could not get WINDOW regions for left sub-areas.")
             return {'CANCELLED'}
@@ -414,37 +401,26 @@ class VIEW3D_OT_open_silhouette_split_current(Operator):
         # Configure silhouettes on left sub-areas only: FRONT (top), RIGHT (bottom)
         _configure_silhouette_area(context, win, left_top, reg_top, axis='FRONT')
         _configure_silhouette_area(context, win, left_bottom, reg_bottom, axis='RIGHT')
-        _apply_view_axis(win, left_top, reg_top, 'FRONT')
-        _apply_view_axis(win, left_bottom, reg_bottom, 'RIGHT')
 
         # Finalize with a tiny deferred re-apply to ensure distinct axes and hidden UI stick
         def _post_fix():
             try:
                 # Re-apply axis and UI hiding in case Blender changed anything after framing
-                _apply_view_axis(win, left_top, reg_top, 'FRONT')
-                _apply_view_axis(win, left_bottom, reg_bottom, 'RIGHT')
+                _reassert(win, left_top, reg_top, 'FRONT')
+                _reassert(win, left_bottom, reg_bottom, 'RIGHT')
                 # If both ended up identical, rotate bottom by +90deg around Z to guarantee RIGHT
-                try:
-                    from mathutils import Quaternion
-                    qt = left_top.spaces.active.region_3d.view_rotation.copy()
-                    qb = left_bottom.spaces.active.region_3d.view_rotation.copy()
-                    same = all(abs(a - b) < 1e-5 for a, b in zip(qt, qb))
-                    if same:
-                        z90 = Quaternion((0.70710678, 0.0, 0.0, 0.70710678))  # +90 deg around Z
-                        left_bottom.spaces.active.region_3d.view_rotation = (z90 @ qt)
-                        left_bottom.spaces.active.region_3d.view_perspective = 'ORTHO'
-                except Exception:
-                    pass
-                # Re-hide UI explicitly
-                for a in (left_top, left_bottom):
-                    sp = a.spaces.active
-                    sp.show_region_header = False
-                    sp.show_region_tool_header = False
-                    sp.show_region_toolbar = False
-                    sp.show_region_ui = False
-                    sp.show_gizmo = False
-                    sp.show_gizmo_navigate = False
-                    sp.overlay.show_overlays = False
+                r3d_top = left_top.spaces.active.region_3d
+                r3d_bot = left_bottom.spaces.active.region_3d
+                if r3d_top is not None and r3d_bot is not None:
+                    qt = r3d_top.view_rotation.copy()
+                    qb = r3d_bot.view_rotation.copy()
+                    # Unit quats are (anti)parallel iff |dot| ~ 1 -- one C call
+                    if abs(qt.dot(qb)) > 0.99999:
+                        r3d_bot.view_rotation = (_Z90 @ qt)
+                        r3d_bot.view_perspective = 'ORTHO'
+                # Single redraw per area once everything is reasserted
+                left_top.tag_redraw()
+                left_bottom.tag_redraw()
             except Exception:
                 pass
             return None
@@ -459,7 +435,10 @@ class VIEW3D_OT_open_silhouette_split_current(Operator):
 # ---- menu ----
 
 def draw_in_view_menu(self, context):
-    if context.mode == 'OBJECT':
+    # active_object is a cached pointer read; context.mode re-derives the
+    # mode string from context state on every menu redraw
+    ob = context.active_object
+    if ob is not None and ob.mode == 'OBJECT':
         # Single dropdown entry instead of two separate items
         self.layout.menu(VIEW3D_MT_silhouette_menu.bl_idname, text="Silhouette")
 
@@ -468,26 +447,38 @@ class VIEW3D_MT_silhouette_menu(bpy.types.Menu):
     bl_label = "Silhouette (Front+Right)"
     bl_idname = "VIEW3D_MT_silhouette_menu"
 
+    # (bl_idname, label) pairs resolved once at class creation, not per draw
+    _ENTRIES = (
+        (VIEW3D_OT_open_silhouette_split_current.bl_idname, "Split Here (Front+Right)"),
+        (VIEW3D_OT_open_silhouette_view_dual.bl_idname, "New Window (Front+Right)"),
+    )
+
     def draw(self, context):
         layout = self.layout
-        layout.operator("view3d.open_silhouette_split_current", text="Split Here (Front+Right)")
-        layout.operator("view3d.open_silhouette_view_dual", text="New Window (Front+Right)")
+        for idname, label in self._ENTRIES:
+            layout.operator(idname, text=label)
 
 
 # ---- register ----
 
+classes = (
+    VIEW3D_OT_open_silhouette_split_current,
+    VIEW3D_OT_open_silhouette_view_dual,
+    VIEW3D_MT_silhouette_menu,
+)
+
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(classes)
+
+
 def register():
-    bpy.utils.register_class(VIEW3D_OT_open_silhouette_split_current)
-    bpy.utils.register_class(VIEW3D_OT_open_silhouette_view_dual)
-    bpy.utils.register_class(VIEW3D_MT_silhouette_menu)
+    _probe_view_axis_operator()
+    _register_classes()
     bpy.types.VIEW3D_MT_view.append(draw_in_view_menu)
 
 
 def unregister():
     bpy.types.VIEW3D_MT_view.remove(draw_in_view_menu)
-    bpy.utils.unregister_class(VIEW3D_MT_silhouette_menu)
-    bpy.utils.unregister_class(VIEW3D_OT_open_silhouette_split_current)
-    bpy.utils.unregister_class(VIEW3D_OT_open_silhouette_view_dual)
+    _unregister_classes()
 
 if __name__ == "__main__":
     register()